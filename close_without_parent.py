@@ -8,11 +8,18 @@ Make sure to configure the variables below, especially
 - API token 
 """
 
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
 import logging
-from typing import Any
+import sys
+from typing import TYPE_CHECKING, Any
 
-from jira.client import ResultList
-from jira.resources import Issue
+# the jira package is imported lazily in run() so --help and config
+# errors do not pay for it
+if TYPE_CHECKING:
+    from jira.client import ResultList
+    from jira.resources import Issue
 
 from helpers.jira_connector import JiraConnector
 
@@ -35,22 +42,49 @@ class Closer(JiraConnector):
         self.parser.add_argument('-p', '--project-key')
         self.parser.add_argument('-s', '--stale-days', type=int)
         self.parser.add_argument('-t', '--transition-to')
+        self.parser.add_argument('-w', '--workers', type=int, default=8,
+            help='Number of parallel workers used to comment on and transition issues.')
+
+    def _close(self, issue: Issue, comment: str, transition_id: str):
+        """Comment on a single issue and transition it to the final status"""
+        print(f' {issue.key} | {issue.fields.issuetype} | {issue.fields.summary}')
+        self.jira.add_comment(issue, comment)
+        self.jira.transition_issue(issue, transition_id)
 
     def run(self):
-        issues: ResultList[Issue]|dict[str, Any] = self.jira.search_issues(f'project = "{self.args.project_key}" AND type IN (Task, Story, Bug, Epic) AND status NOT IN (Done, Rejected) AND parent is null AND updated <= -{self.args.stale}d ORDER BY created DESC', maxResults=500)
+        from jira.client import ResultList
+
+        issues: ResultList[Issue]|dict[str, Any] = self.jira.search_issues(f'project = "{self.args.project_key}" AND type IN (Task, Story, Bug, Epic) AND status NOT IN (Done, Rejected) AND parent is null AND updated <= -{self.args.stale}d ORDER BY updated ASC', maxResults=False, fields='summary,issuetype')
+
+        if not isinstance(issues, ResultList):
+            logger.error('search_issues returned an unexpected json result')
+            sys.exit(1)
 
         print(f'Rejecting {len(issues)} issues with comment:')
 
-        for issue in issues:
-            assert type(issue) is Issue or exit(1)
-            comment =f'Issue will be closed because it does not have a parent and it has not been updated for {self.args.stale} days'
-            if self.args.dry_run:
-                print(f' {issue.key} | {issue.fields.issuetype} | {issue.fields.summary}')
-                print(f' {comment}')
-            else:
-                print(f' {issue.key} | {issue.fields.issuetype} | {issue.fields.summary}')
-                self.jira.add_comment(issue, comment)
-                self.jira.transition_issue(issue, str(self.args.transition_to))
+        # the comment and transition are the same for every issue
+        comment = f'Issue will be closed because it does not have a parent and it has not been updated for {self.args.stale} days'
+        transition_id = str(self.args.transition_to)
+
+        if self.args.dry_run:
+            # only prints; buffer the lines and write them in one go
+            # instead of two flushing print calls per issue
+            lines = [
+                f' {issue.key} | {issue.fields.issuetype} | {issue.fields.summary}\n {comment}\n'
+                for issue in issues
+            ]
+            sys.stdout.write(''.join(lines))
+        else:
+            # closing an issue is two blocking REST calls, so run the
+            # issues through a thread pool to overlap request latencies
+            with ThreadPoolExecutor(max_workers=self.args.workers) as executor:
+                futures = [
+                    executor.submit(self._close, issue, comment, transition_id)
+                    for issue in issues
+                ]
+                for future in futures:
+                    # surfaces a JIRAError from the worker, if any
+                    future.result()
         
 
 if __name__ == "__main__":
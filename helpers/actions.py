@@ -10,8 +10,11 @@ class EnvDefault(Action):
     """
     def __init__(self, envvar, required=True, default=None, **kwargs):
         if envvar:
-            if envvar in environ:
+            # EAFP: one dict lookup instead of membership test plus read
+            try:
                 default = environ[envvar]
+            except KeyError:
+                pass
         if required and default:
             required = False
         super(EnvDefault, self).__init__(default=default, required=required, **kwargs)
@@ -16,16 +16,23 @@ and or the options given to argparse in the `configuration` method
 - This does not consider company closing times or holidays
 """
 
+from __future__ import annotations
+
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 import sys
 
 from datetime import datetime, timedelta
 import logging
 from string import Template
+from typing import TYPE_CHECKING
 
-from jira import Issue, JIRAError
-from jira.client import ResultList
-from jira.resources import Sprint
+# the jira package is imported lazily in run() so --help and config
+# errors do not pay for it
+if TYPE_CHECKING:
+    from jira import Issue
+    from jira.client import ResultList
+    from jira.resources import Sprint
 
 from .jira_connector import JiraConnector
 
@@ -35,12 +42,22 @@ class CreateAndAssignTasks(JiraConnector, ABC):
 
     epic: Issue
 
+    # compiled sprint name template, built on first use
+    _sprint_template: Template | None = None
+
+    # the parts of the issue data that are the same for every issue,
+    # built once in run() for subclasses to extend in issue_data
+    issue_scaffold: dict
+
     """
     This class wraps the creating and assigning issues to a people queue
     """
     def __init__(self, config_file):
         """Inject correct configuration file in super class"""
         super(CreateAndAssignTasks, self).__init__(config_file)
+        # issues queued as (data, email, sprint_id) tuples and created
+        # with one bulk request at the end of run()
+        self._pending_issues: list[tuple[dict, str, int]] = []
 
     def configure(self):
         """Vanguard specific configuration options"""
@@ -57,8 +74,11 @@ class CreateAndAssignTasks(JiraConnector, ABC):
 
     def sprint_name(self, index: int = 0) -> str:
         """Sprint name from year, starting number and pulse"""
+        if self._sprint_template is None:
+            # Template objects are reusable, no need to re-parse per call
+            self._sprint_template = Template(self.args.sprint_template)
         try:
-            template = Template(self.args.sprint_template).substitute(
+            template = self._sprint_template.substitute(
                 sprint_number=f'{self.args.sprint_starting_number + index:02d}'
             )
             logger.debug(f'Sprint template compiled to: {template}')
@@ -74,16 +94,52 @@ class CreateAndAssignTasks(JiraConnector, ABC):
             )
             print(data)
         else:
-            created = self.jira.create_issue(data)
-            self.jira.assign_issue(created.key, email)
-            created.update({
-            'customfield_10020': sprint_id,  # 10020 is the custom field for sprints
-            })
+            # queued here, created in bulk by create_pending_issues
+            self._pending_issues.append((data, email, sprint_id))
             logger.debug(
-                f'created issue for {email} and sprint {sprint_id}:'
+                f'queued issue for {email} and sprint {sprint_id}:'
             )
             logger.debug(data)
 
+    def _finalize_issue(self, created: Issue, email: str, sprint_id: int):
+        """Assign a freshly created issue and move it into its sprint"""
+        self.jira.assign_issue(created.key, email)
+        # async_=False keeps the update synchronous although the
+        # client is configured for async page fetches
+        created.update({
+        'customfield_10020': sprint_id,  # 10020 is the custom field for sprints
+        }, async_=False)
+
+    def create_pending_issues(self):
+        """
+        Create all queued issues with a single bulk request and
+        assign them to their assignee and sprint in parallel
+        """
+        if not self._pending_issues:
+            return
+
+        # prefetch=False skips the per-issue GET the client would do
+        # after the bulk POST; _finalize_issue only needs key and self
+        results = self.jira.create_issues(
+            field_list=[data for data, _, _ in self._pending_issues],
+            prefetch=False
+        )
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            futures = []
+            for result, (data, email, sprint_id) in zip(results, self._pending_issues):
+                if result['status'] != 'Success':
+                    sys.stderr.write(
+                        f'Could not create issue {data["summary"]}: {result["error"]}\n'
+                    )
+                    continue
+                futures.append(
+                    executor.submit(self._finalize_issue, result['issue'], email, sprint_id)
+                )
+            for future in futures:
+                # surfaces a JIRAError from the worker, if any
+                future.result()
+        self._pending_issues = []
+
     @abstractmethod
     def issue_data(self, sname, week, formatted_start_date):
         """
@@ -103,11 +159,26 @@ class CreateAndAssignTasks(JiraConnector, ABC):
                 "id": epic_to_nest_this_under.id
             },
         }
+
+        The project/issuetype/parent part is prebuilt as
+        self.issue_scaffold, so implementations only need to add
+        summary and description:
+            return {**self.issue_scaffold, "summary": ..., "description": ...}
         """
         return {}
 
-    def prepare_and_assign_issue(self, sprint, assignee_email, week):
-        start_date = datetime.strptime(sprint.startDate, '%Y-%m-%dT%H:%M:%S.%fZ')
+    def _sprint_slots(self, sprint) -> int:
+        """
+        Number of issues the assignment loop can place in a sprint:
+        short sprints (under 8 days) only fit one issue, long/standard
+        sprints two
+        """
+        length = (datetime.fromisoformat(sprint.endDate)
+                  - datetime.fromisoformat(sprint.startDate))
+        return 1 if length.days < 8 else 2
+
+    def prepare_and_assign_issue(self, sprint, assignee_email, week, start_date):
+        """start_date is the already parsed sprint.startDate"""
         days = 1 if week == 1 else 8
 
         issue_data = self.issue_data(
@@ -122,42 +193,81 @@ class CreateAndAssignTasks(JiraConnector, ABC):
         )
 
     def run(self):
+        from jira import JIRAError
+
         try:
-            self.epic = self.jira.issue(self.args.epic)
+            self.epic = self.cached_issue(self.args.epic)
         except JIRAError:
             sys.stderr.write(f"Epic {self.args.epic} to create child issues not found.")
             exit(2)
 
+        # the scaffolding is identical for every issue we create
+        self.issue_scaffold = {
+            'project': {'key': self.args.project},
+            'issuetype': {'name': 'Task'},  # Assuming the task type is named as such
+            'parent': {'id': self.epic.id},
+        }
+
         # Get the sprints for the given scrum board
         logger.debug(f'getting active and future sprints for board {self.args.board}')
-        sprints: ResultList[Sprint] = self.jira.sprints(board_id=self.args.board, state='active,future')
+        # maxResults=False lets the client page with its maximum page
+        # size instead of the default 50-sprint pages
+        sprints: ResultList[Sprint] = self.jira.sprints(
+            board_id=self.args.board, state='active,future', maxResults=False
+        )
         sprints_to_assign = list()
-        issues_in_first_sprint = -1 
+        issues_in_first_sprint = -1
+
+        # count the existing child issues for all sprints with a single
+        # bulk query instead of one search per sprint; 'sprint in ()'
+        # is invalid JQL, so skip the query when there are no sprints
+        issues_per_sprint: dict[int, int] = {}
+        if sprints:
+            sprint_ids = ",".join(str(sprint.id) for sprint in sprints)
+            existing_issues = self.jira.search_issues(
+                f'project = "{self.args.project}" AND sprint in ({sprint_ids})'
+                f' AND parent = {self.epic.key}',
+                # 10020 is the custom field for sprints, the only field we read
+                fields='customfield_10020',
+                maxResults=False
+            )
+            for issue in existing_issues:
+                # 10020 is the custom field for sprints
+                for issue_sprint in issue.fields.customfield_10020 or []:
+                    issues_per_sprint[issue_sprint.id] = issues_per_sprint.get(issue_sprint.id, 0) + 1
 
+        free_slots = 0
         for sprint in sprints:
             if issues_in_first_sprint >= 0:
                 # we already found the sprint to start with
                 sprints_to_assign.append(sprint)
+                free_slots += self._sprint_slots(sprint)
             else:
-                issues_in_sprint = len(self.jira.search_issues(
-                    f'project = "{self.args.project}" AND sprint = {sprint.id}'
-                    f' AND parent = {self.epic.key}'
-                ))
+                issues_in_sprint = issues_per_sprint.get(sprint.id, 0)
                 if issues_in_sprint < 2:
                     logger.debug(f'Found first sprint: {sprint}')
                     sprints_to_assign.append(sprint)
                     issues_in_first_sprint = issues_in_sprint
+                    free_slots += max(self._sprint_slots(sprint) - issues_in_sprint, 0)
                 else:
                     print(f'Found two or more issues in sprint {sprint}. Continue searching...')
+            # stop scanning once the collected sprints have enough free
+            # slots for all assignees; short sprints only count one
+            if free_slots >= len(self.args.assignee):
+                break
 
+        # bind the assignee queue to a local, self.args.assignee would
+        # walk the namespace per loop iteration
+        assignees = self.args.assignee
         assignee_idx = 0
         for sprint in sprints_to_assign:
             logger.debug(f'Processing sprint {sprint}')
-            start_date = datetime.strptime(sprint.startDate, '%Y-%m-%dT%H:%M:%S.%fZ')
-            end_date = datetime.strptime(sprint.endDate, '%Y-%m-%dT%H:%M:%S.%fZ')
+            # fromisoformat parses in C and is much faster than strptime
+            start_date = datetime.fromisoformat(sprint.startDate)
+            end_date = datetime.fromisoformat(sprint.endDate)
             length = end_date - start_date
             logger.debug(f'sprint length {length.days}')
-            assignee_email = self.args.assignee[assignee_idx]
+            assignee_email = assignees[assignee_idx]
             if length.days < 8:
                 # Long sprints usually are 10 days (Monday to next Thursday),
                 # short ones are 3 days.
@@ -166,23 +276,25 @@ class CreateAndAssignTasks(JiraConnector, ABC):
                     print(f'Continueing, no space in sprint {sprint.name} for another issue')
                 else:
                     logger.debug('short sprint can create one issue')
-                    self.prepare_and_assign_issue(sprint, assignee_email, 1)
+                    self.prepare_and_assign_issue(sprint, assignee_email, 1, start_date)
             else:
                 if issues_in_first_sprint == 1:
                     logger.debug('long/standard sprint can create one issue for second week')
-                    self.prepare_and_assign_issue(sprint, assignee_email, 2)
+                    self.prepare_and_assign_issue(sprint, assignee_email, 2, start_date)
                 else:
                     logger.debug('long/standard sprint can create one two issues')
-                    self.prepare_and_assign_issue(sprint, assignee_email, 1)
+                    self.prepare_and_assign_issue(sprint, assignee_email, 1, start_date)
                     assignee_idx +=1
 
-                    assignee_email = self.args.assignee[assignee_idx]
-                    self.prepare_and_assign_issue(sprint, assignee_email, 2)
+                    assignee_email = assignees[assignee_idx]
+                    self.prepare_and_assign_issue(sprint, assignee_email, 2, start_date)
             issues_in_first_sprint = 0
             assignee_idx +=1
-        
-        if assignee_idx < len(self.args.assignee):
+
+        self.create_pending_issues()
+
+        if assignee_idx < len(assignees):
             print('Not enough sprints to assign the following people')
-            while assignee_idx < len(self.args.assignee):
-                print(f' - {self.args.assignee[assignee_idx]}')
+            while assignee_idx < len(assignees):
+                print(f' - {assignees[assignee_idx]}')
                 assignee_idx +=1
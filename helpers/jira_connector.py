@@ -11,18 +11,46 @@ To inject a people_queue use comma separated values in the environment variable:
   export JIRA_PEOPLE_QUEUE=person1.example.com,person2.example.com
 """
 
+from __future__ import annotations
+
 from abc import ABC, abstractmethod
 import argparse
+from functools import lru_cache
 import logging
+from typing import TYPE_CHECKING
 import yaml
 
-from jira import JIRA
+# prefer the libyaml C extension parser when it is available
+try:
+    from yaml import CSafeLoader as YamlSafeLoader
+except ImportError:
+    from yaml import SafeLoader as YamlSafeLoader
+
+# the jira package (and the requests stack it pulls in) is imported
+# lazily in __init__ so --help and config errors do not pay for it
+if TYPE_CHECKING:
+    from jira import JIRA
+    from jira.resources import Issue
 
 from helpers.actions import EnvDefault, RequiredOrDefault
 
 
 logger = logging.getLogger('jira_helpers')
 
+# parsed config files keyed by path, shared when several helpers are
+# instantiated in the same process
+_YAML_CACHE: dict[str, dict] = {}
+
+@lru_cache(maxsize=256)
+def _cached_issue(jira: JIRA, key: str) -> Issue:
+    """
+    Fetch an issue once per (client, key) pair.
+
+    Issues like epics change rarely, so repeated lookups of the same key
+    within a run do not need another round-trip.
+    """
+    return jira.issue(key)
+
 class JiraConnector(ABC):
     """
     Abstract class that handles connection to Jira and
@@ -58,13 +86,17 @@ class JiraConnector(ABC):
 
         # add default values from config files
         logger.debug(f'trying to load defaults from {self.config_file}')
-        with open(self.config_file) as stream:
-            try:
-                self._yaml_config = yaml.safe_load(stream)
-                self.parser.set_defaults(**self._yaml_config)
-            except yaml.YAMLError as exc:
-                print(exc)
-                exit(1)
+        cached = _YAML_CACHE.get(self.config_file)
+        if cached is None:
+            with open(self.config_file) as stream:
+                try:
+                    cached = yaml.load(stream, Loader=YamlSafeLoader)
+                except yaml.YAMLError as exc:
+                    print(exc)
+                    exit(1)
+            _YAML_CACHE[self.config_file] = cached
+        self._yaml_config = cached
+        self.parser.set_defaults(**self._yaml_config)
 
         self.parser.add_argument('-b', '--base-url', required=True, action=RequiredOrDefault,
             help='The URL of your Jira instance.')
@@ -79,17 +111,18 @@ class JiraConnector(ABC):
             help='Overwrite a dry run setting from config file.')
         self.parser.add_argument('-v', '--verbose', action='store_true',
             help='Show debug logging output.', )
+        self.parser.add_argument('--async-workers', type=int, default=5,
+            help='Number of threads used to fetch search result pages in parallel.')
 
         # let sub-classes inject their own parameters
         self.configure()
 
-        with open(self.config_file) as stream:
-            try:
-                self._yaml_config = yaml.safe_load(stream)
-                self.parser.set_defaults(**self._yaml_config)
-            except yaml.YAMLError as exc:
-                print(exc)
-                exit(1)
+        # apply the config file defaults once more: argparse only
+        # back-fills parser-level defaults into arguments declared
+        # without an explicit default, so arguments added above or in
+        # configure() with default=... need this second pass (the
+        # parsed config is reused, the file is not read again)
+        self.parser.set_defaults(**self._yaml_config)
 
         # update args from command line and environment variables
         # overrides config file defaults above
@@ -104,7 +137,49 @@ class JiraConnector(ABC):
 
         # Authenticate with JIRA server and create a client
         logger.debug(f'logging in to Jira at {base_url} as {username}')
-        self.jira = JIRA(base_url, basic_auth=(username, api_token))
+        # page issue searches in batches of 100 - larger pages tend to
+        # time out on busy Jira instances
+        from jira import JIRA
+        from jira.resources import Issue
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+
+        # the jira client falls back to serial page fetches silently
+        # when requests-futures is missing, so make that visible
+        try:
+            import requests_futures  # noqa: F401
+        except ImportError:
+            logger.warning(
+                'requests-futures is not installed, search result pages will be fetched serially'
+            )
+
+        self.jira = JIRA(
+            base_url,
+            basic_auth=(username, api_token),
+            default_batch_sizes={Issue: 100},
+            async_=True,
+            async_workers=self.args.async_workers,
+        )
+
+        # reuse connections across the many small REST calls the helpers
+        # make and retry transient server-side errors with backoff
+        adapter = HTTPAdapter(
+            pool_connections=32,
+            pool_maxsize=32,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.3,
+                status_forcelist=[429, 500, 502, 503, 504],
+            ),
+        )
+        self.jira._session.mount('https://', adapter)
+
+    def cached_issue(self, key: str) -> Issue:
+        """
+        Like self.jira.issue but memoized, for lookups that are
+        repeated within a run (e.g. the epic to nest issues under)
+        """
+        return _cached_issue(self.jira, key)
 
     @abstractmethod
     def configure(self):
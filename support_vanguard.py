@@ -38,16 +38,14 @@ class Vanguard(CreateAndAssignTasks):
         """Inject correct support file in super class"""
         super(Vanguard, self).__init__("support_vanguard.yaml")
 
-    def issue_data(self, epic, sname, idx, formatted_start_date):
+    def issue_data(self, sname, week, formatted_start_date):
         return {
-            "project": {"key": self.args.project},
-            "summary": f"Support Vanguard for {sname} week {idx%2 + 1} ({formatted_start_date})",
+            **self.issue_scaffold,
+            "summary": f"Support Vanguard for {sname} week {week} ({formatted_start_date})",
             "description": (
                 f"Provide support Vanguard for the week from {formatted_start_date}.\n\n"
                 "See https://discourse.maas.io/t/the-support-vanguard/4658 for more details."
             ),
-            "issuetype": {"name": "Task"},  # Assuming the task type is named as such
-            "parent": {"id": epic.id},
         }
 
 
@@ -14,12 +14,19 @@ Make sure to configure the variables below, especially
 - API token
 """
 
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property
 import logging
-from typing import Any
+import sys
+from typing import TYPE_CHECKING, Any, Callable
 
-from jira import JIRAError
-from jira.client import ResultList
-from jira.resources import Issue, Component
+# the jira package is imported lazily in run() so --help and config
+# errors do not pay for it
+if TYPE_CHECKING:
+    from jira.client import ResultList
+    from jira.resources import Issue, Component
 
 from helpers.jira_connector import JiraConnector
 
@@ -52,10 +59,21 @@ class UpdateChildren(JiraConnector):
 
     root: Issue
 
+    # per-field builders for the to-be values, selected once in run()
+    # according to the overwrite/append mode instead of re-branching
+    # per child
+    _components_fn: Callable[[list[Component]], list[dict[str, str]]]
+
+    _labels_fn: Callable[[list[str]], list[str]]
+
+    _versions_fn: Callable[[list[Any]], list[Any]]
+
     def __init__(self):
         """Inject correct support file in super class"""
         super(UpdateChildren, self).__init__("update_children.yaml")
         self.children = []
+        # dry-run report, buffered and written in one go at the end
+        self._dry_run_lines: list[str] = []
 
 
     def configure(self):
@@ -73,88 +91,215 @@ class UpdateChildren(JiraConnector):
                  'that are not present in the parent. '
                  'If you specify "-o" you do not need "-a".')
 
+    # The root does not change while the children are processed, so
+    # its field data is materialized once on first access.
+
+    @cached_property
+    def _root_components(self) -> set[Component]:
+        return set(self.root.fields.components)
+
+    @cached_property
+    def _root_components_prepared(self) -> list[dict[str, str]]:
+        """Root components already serialized for the update payload"""
+        return prepare_components(self.root.fields.components)
+
+    @cached_property
+    def _root_labels(self) -> set[str]:
+        return set(self.root.fields.labels)
+
+    @cached_property
+    def _root_labels_list(self) -> list[str]:
+        return list(self._root_labels)
+
+    @cached_property
+    def _root_versions(self) -> set[Any]:
+        return set(self.root.fields.fixVersions)
+
+    @cached_property
+    def _root_versions_raw(self) -> list[Any]:
+        """Root versions already serialized for the update payload"""
+        return [version.raw for version in self._root_versions]
+
+    def _field_mode(self, field: str) -> str | None:
+        """
+        Resolve whether the given field is overwritten, appended or
+        left alone; "-o" takes precedence over "-a"
+        """
+        if self.args.overwrite and field in self.args.overwrite:
+            return 'overwrite'
+        if self.args.append and field in self.args.append:
+            return 'append'
+        return None
+
+    # to-be value builders, one per field and mode; run() picks the
+    # right one per field so update_child is branch-free
+
+    def _components_overwrite(self, child_components: list[Component]) -> list[dict[str, str]]:
+        return self._root_components_prepared
+
+    def _components_append(self, child_components: list[Component]) -> list[dict[str, str]]:
+        # dedupe by name rather than by resource hash, the payload
+        # only carries names anyway
+        return list({
+            component.name: {'name': component.name}
+            for component in list(self._root_components) + list(child_components)
+        }.values())
+
+    def _labels_overwrite(self, child_labels: list[str]) -> list[str]:
+        return list(self._root_labels | set(child_labels))
+
+    def _labels_append(self, child_labels: list[str]) -> list[str]:
+        return self._root_labels_list
+
+    def _versions_overwrite(self, child_versions: list[Any]) -> list[Any]:
+        # dedupe by version id rather than by resource hash
+        return list({
+            version.id: version.raw
+            for version in list(self._root_versions) + list(child_versions)
+        }.values())
+
+    def _versions_append(self, child_versions: list[Any]) -> list[Any]:
+        return self._root_versions_raw
+
+    @staticmethod
+    def _untouched(child_values) -> list:
+        return []
+
     def update_child(self, child):
         """
         Updates the child to the to be value
         or prints the as is and to be values in case of a dry run
         """
-        root_components: list[Component] = self.root.fields.components
         child_components: list[Component] = child.fields.components
-        to_be_components: list[dict[str,str]] = []
-
-        root_labels: list[str] = self.root.fields.labels
         child_labels: list[str] = child.fields.labels
-        to_be_labels: list[str] = []
-
-        root_versions: list[Any] = self.root.fields.fixVersions
         child_versions: list[Any] = child.fields.fixVersions
-        to_be_versions: list[str] = []
-
-        logger.debug(f'appending {self.args.append}')
-        logger.debug(f'overwriting {self.args.overwrite}')
-
-        if self.args.overwrite and 'components' in self.args.overwrite:
-            for component in root_components:
-                to_be_components.append({'name': component.name})
-        elif self.args.append and 'components' in self.args.append:
-            for component in list(set(root_components).union(child_components)):
-                to_be_components.append({'name': component.name})
 
-        if self.args.overwrite and 'labels' in self.args.overwrite:
-            to_be_labels = list(set(root_labels).union(child_labels))
-        elif self.args.append and 'labels' in self.args.append:
-            to_be_labels = list(root_labels)
-
-        if self.args.overwrite and 'versions' in self.args.overwrite:
-            to_be_versions = [ version.raw for version in list(set(root_versions).union(child_versions)) ]
-        elif self.args.append and 'versions' in self.args.append:
-            to_be_versions = [ version.raw for version in list(root_versions) ]
+        to_be_components = self._components_fn(child_components)
+        to_be_labels = self._labels_fn(child_labels)
+        to_be_versions = self._versions_fn(child_versions)
 
         if self.args.dry_run:
-            print(f'{child.key}: {child.fields.summary}')
-            print('Running this would update the following components')
-            print(f' - Components as is : {format_components(child_components)}')
-            print(f' - Components to be : {list(map(lambda c : c['name'], to_be_components))}')
-            print('Running this would update the following labels')
-            print(f' - Labels as is : {child_labels}')
-            print(f' - Labels to be : {to_be_labels}')
-            print('Running this would update the following version')
-            print(f' - Version as is : {child_versions}')
-            print(f' - Version to be : {to_be_versions}')
-            print()
+            as_is_names = format_components(child_components)
+            to_be_names = [component['name'] for component in to_be_components]
+            self._dry_run_lines.append(
+                f'{child.key}: {child.fields.summary}\n'
+                'Running this would update the following components\n'
+                f' - Components as is : {as_is_names}\n'
+                f' - Components to be : {to_be_names}\n'
+                'Running this would update the following labels\n'
+                f' - Labels as is : {child_labels}\n'
+                f' - Labels to be : {to_be_labels}\n'
+                'Running this would update the following version\n'
+                f' - Version as is : {child_versions}\n'
+                f' - Version to be : {to_be_versions}\n'
+                '\n'
+            )
         else:
+            # skip the PUT when the child already carries the target
+            # values (common in append mode)
+            changed = (
+                {component.name for component in child_components}
+                    != {component['name'] for component in to_be_components}
+                or set(child_labels) != set(to_be_labels)
+                or {version.id for version in child_versions}
+                    != {version['id'] for version in to_be_versions}
+            )
+            if not changed:
+                logger.debug(f'{child.key} already up to date, skipping')
+                return
+
             data = {
                 'components': to_be_components,
                 'labels': to_be_labels,
                 'fixVersions': to_be_versions
             }
-            child.update(fields = data)
+            # child.update() would re-fetch the issue after the PUT;
+            # nothing reads the refreshed fields, so PUT directly
+            # (the resilient session raises a JIRAError on failure)
+            self.jira._session.put(child.self, json={'fields': data})
 
     def walk_children(self, parent):
         """
-        Recursively gathers all children from the parent and adds them
-        to the list of self.children to be processed
+        Gathers all descendants of the parent level by level and adds
+        them to the list of self.children to be processed
+
+        All siblings of one level are fetched with a single
+        'parent in (...)' query, so the number of requests grows with
+        the tree depth instead of the number of issues.
         """
-        children: ResultList[Issue]|dict[str, Any] = self.jira.search_issues(f'parent={parent}')
-        assert type(children) is ResultList
+        # the search goes out as a GET, so wide levels are queried in
+        # batches to keep the JQL clause and URL length bounded
+        batch_size = 100
+        frontier: list[str] = [str(parent)]
+        while frontier:
+            level: list[Issue] = []
+            for start in range(0, len(frontier), batch_size):
+                batch = frontier[start:start + batch_size]
+                children: ResultList[Issue] = self.jira.search_issues(
+                    f'parent in ({",".join(batch)})',
+                    fields='summary,components,labels,fixVersions',
+                    maxResults=False
+                )
+                level.extend(children)
 
-        for child in children:
-            self.children.append(child)
-            self.walk_children(child)
+            self.children.extend(level)
+            frontier = [child.key for child in level]
 
     def run(self):
-        try:
-            issue: Issue = self.jira.issue(self.args.issue)
-            self.root = issue
-        except JIRAError as je:
-            print(je)
-            print(f'Issue with key {self.args.issue} not found.')
-            exit(1)
-
-        self.walk_children(self.root)
-
-        for node in self.children:
-            self.update_child(node)
+        from jira import JIRAError
+
+        # the walk only needs the issue key, so it can run while the
+        # root issue details are still being fetched
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            root_future = executor.submit(
+                self.jira.issue, self.args.issue,
+                fields='summary,components,labels,fixVersions'
+            )
+            walk_future = executor.submit(self.walk_children, self.args.issue)
+            try:
+                self.root = root_future.result()
+            except JIRAError as je:
+                print(je)
+                print(f'Issue with key {self.args.issue} not found.')
+                exit(1)
+            walk_future.result()
+
+        # frozensets give O(1) membership tests in _field_mode and
+        # guard the option lists against accidental mutation
+        self.args.overwrite = frozenset(self.args.overwrite or ())
+        self.args.append = frozenset(self.args.append or ())
+
+        logger.debug(f'appending {self.args.append}')
+        logger.debug(f'overwriting {self.args.overwrite}')
+        self._components_fn = {
+            'overwrite': self._components_overwrite,
+            'append': self._components_append,
+            None: self._untouched,
+        }[self._field_mode('components')]
+        self._labels_fn = {
+            'overwrite': self._labels_overwrite,
+            'append': self._labels_append,
+            None: self._untouched,
+        }[self._field_mode('labels')]
+        self._versions_fn = {
+            'overwrite': self._versions_overwrite,
+            'append': self._versions_append,
+            None: self._untouched,
+        }[self._field_mode('versions')]
+
+        if self.args.dry_run:
+            # only collects report lines, keep the output ordered
+            for node in self.children:
+                self.update_child(node)
+            sys.stdout.write(''.join(self._dry_run_lines))
+        else:
+            # each update is a blocking REST call, so run the children
+            # through a thread pool to overlap request latencies
+            with ThreadPoolExecutor(max_workers=16) as executor:
+                futures = [executor.submit(self.update_child, node) for node in self.children]
+                for future in futures:
+                    # surfaces a JIRAError from the worker, if any
+                    future.result()
 
 
 if __name__ == "__main__":